@@ -13,9 +13,10 @@ The :mod:`rotate_backups` module contains the Python API of the
 """
 
 # Standard library modules.
-import collections
 import datetime
 import fnmatch
+import heapq
+import logging
 import numbers
 import os
 import re
@@ -25,10 +26,10 @@ import shlex
 from dateutil.relativedelta import relativedelta
 from executor import ExternalCommandFailed
 from executor.concurrent import CommandPool
-from executor.contexts import RemoteContext, create_context
+from executor.contexts import LocalContext, RemoteContext, create_context
 from humanfriendly import Timer, coerce_boolean, coerce_pattern, format_path, parse_path
 from humanfriendly.text import concatenate, pluralize, split
-from natsort import natsort
+from natsort import natsort_key
 from property_manager import (
     PropertyManager,
     cached_property,
@@ -52,6 +53,15 @@ logger = VerboseLogger(__name__)
 DEFAULT_REMOVAL_COMMAND = ['rm', '-fR']
 """The default removal command (a list of strings)."""
 
+REMOVAL_BATCH_LIMIT = 1024 * 64
+"""
+The maximum combined length of the pathnames given to a single removal command (an integer).
+
+This limit keeps batched removal commands well below the limits that
+operating systems impose on the length of command lines (also when the
+command line is passed to a remote system over SSH as a single string).
+"""
+
 ORDERED_FREQUENCIES = (
     ('minutely', relativedelta(minutes=1)),
     ('hourly', relativedelta(hours=1)),
@@ -93,19 +103,23 @@ dictionary is generated based on the tuples in :data:`ORDERED_FREQUENCIES`.
 
 TIMESTAMP_PATTERN = re.compile(r'''
     # Required components.
-    (?P<year>\d{4} ) \D?
-    (?P<month>\d{2}) \D?
-    (?P<day>\d{2}  ) \D?
+    (?P<year>[12]\d{3}) \D?
+    (?P<month>[01]\d  ) \D?
+    (?P<day>[0-3]\d   ) \D?
     (?:
         # Optional components.
-        (?P<hour>\d{2}  ) \D?
-        (?P<minute>\d{2}) \D?
-        (?P<second>\d{2})?
+        (?P<hour>[0-2]\d  ) \D?
+        (?P<minute>[0-5]\d) \D?
+        (?P<second>[0-5]\d)?
     )?
 ''', re.VERBOSE)
 """
 A compiled regular expression object used to match timestamps encoded in
 filenames.
+
+The character classes only accept the leading digits that can occur in valid
+dates and times, this enables the regular expression engine to skip over
+unrelated digits in filenames without trying all of the optional separators.
 """
 
 
@@ -138,6 +152,21 @@ def coerce_location(value, **options):
     return value
 
 
+def coerce_concurrency(value):
+    """
+    Coerce a concurrency to a positive integer.
+
+    :param value: A number or a string containing a number.
+    :returns: A positive integer.
+    :raises: :exc:`~exceptions.ValueError` when the value can't be coerced.
+    """
+    number = int(value)
+    if number < 1:
+        msg = "Expected a positive integer, got %r instead!"
+        raise ValueError(msg % value)
+    return number
+
+
 def coerce_retention_period(value):
     """
     Coerce a retention period to a Python value.
@@ -166,6 +195,44 @@ def coerce_retention_period(value):
     return value
 
 
+def compile_filename_patterns(patterns):
+    """
+    Combine filename patterns into a single regular expression.
+
+    :param patterns: A list of strings with :mod:`fnmatch` patterns.
+    :returns: A compiled regular expression object that matches the filenames
+              that :func:`fnmatch.fnmatch()` would match with any of the given
+              patterns (after normalization using :func:`os.path.normcase()`)
+              or :data:`None` when no patterns are given.
+
+    This avoids translating every pattern to a regular expression for every
+    filename that is matched against it.
+    """
+    if patterns:
+        return re.compile('|'.join('(?:%s)' % fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+def natural_sort_key(name):
+    """
+    Get a key for natural order sorting of filenames.
+
+    :param name: A filename (a string).
+    :returns: A list of tuples.
+
+    The keys produced by this function result in the same order as
+    :func:`natsort.natsort()` but they're compared using Python's built in
+    comparison of lists and tuples, which is a lot faster than the rich
+    comparison methods of :class:`natsort.NaturalOrderKey`.
+
+    This works because :func:`natsort.natsort_key()` splits names into
+    integers and strings that don't contain digits. Where an integer and a
+    string are compared :class:`~natsort.NaturalOrderKey` compares their
+    text, which is decided by the first character of both, so integers are
+    represented by a tuple starting with the string '0'.
+    """
+    return [(chunk,) if isinstance(chunk, string_types) else ('0', chunk) for chunk in natsort_key(name)]
+
+
 def load_config_file(configuration_file=None, expand=True):
     """
     Load a configuration file with backup directories and rotation schemes.
@@ -271,14 +338,31 @@ class RotateBackups(PropertyManager):
         :param rotation_scheme: Used to set :attr:`rotation_scheme`.
         :param options: Any keyword arguments are used to set the values of
                         instance properties that support assignment
-                        (:attr:`config_file`, :attr:`dry_run`,
-                        :attr:`exclude_list`, :attr:`include_list`,
-                        :attr:`io_scheduling_class`, :attr:`removal_command`
-                        and :attr:`strict`).
+                        (:attr:`concurrency`, :attr:`config_file`,
+                        :attr:`dry_run`, :attr:`exclude_list`,
+                        :attr:`include_list`, :attr:`io_scheduling_class`,
+                        :attr:`removal_command` and :attr:`strict`).
         """
         options.update(rotation_scheme=rotation_scheme)
         super(RotateBackups, self).__init__(**options)
 
+    @mutable_property
+    def concurrency(self):
+        """
+        The maximum number of removal commands to run at the same time (an integer, defaults to 10).
+
+        This is used by :func:`rotate_concurrent()`. Regardless of the value
+        of this property commands that remove backups from the same mount
+        point are never run at the same time. Assigned values are coerced
+        using :func:`coerce_concurrency()`.
+        """
+        return 10
+
+    @concurrency.setter
+    def concurrency(self, value):
+        """Coerce the value of :attr:`concurrency` to a positive integer."""
+        set_property(self, 'concurrency', coerce_concurrency(value))
+
     @mutable_property
     def config_file(self):
         """
@@ -388,6 +472,14 @@ class RotateBackups(PropertyManager):
         it works regardless of whether the user's "backups to be rotated" are
         files or directories or a mixture of both.
 
+        The default command is also efficient for backups consisting of many
+        files: GNU ``rm`` walks directory trees using :man:`fts` and removes
+        entries with ``unlinkat()`` relative to an open directory descriptor,
+        so the kernel doesn't have to resolve the full pathname of every entry
+        (the same approach that ``find -depth -delete`` uses). Additionally
+        the default command is given multiple backups at once (see
+        :func:`batch_removals()`).
+
         .. versionadded: 5.3
            This option was added as a generalization of the idea suggested in
            `pull request 11`_, which made it clear to me that being able to
@@ -457,6 +549,17 @@ class RotateBackups(PropertyManager):
         """
         return False
 
+    @lazy_property
+    def timestamp_cache(self):
+        """
+        A cache used by :func:`match_to_datetime()` (a dictionary).
+
+        The keys of this dictionary are the values captured by
+        :attr:`timestamp_pattern` and the values are
+        :class:`~datetime.datetime` objects.
+        """
+        return {}
+
     @mutable_property
     def timestamp_pattern(self):
         """
@@ -505,27 +608,29 @@ class RotateBackups(PropertyManager):
         :param kw: Any keyword arguments are passed on to :func:`rotate_backups()`.
 
         This function uses :func:`rotate_backups()` to prepare rotation
-        commands for the given locations and then it removes backups in
-        parallel, one backup per mount point at a time.
+        commands for the given locations and then it runs those commands in
+        parallel, one command per mount point at a time.
 
         The idea behind this approach is that parallel rotation is most useful
         when the files to be removed are on different disks and so multiple
         devices can be utilized at the same time.
+        The number of commands that run at the same time is limited by
+        :attr:`concurrency`.
 
         Because mount points are per system :func:`rotate_concurrent()` will
         also parallelize over backups located on multiple remote systems.
         """
         timer = Timer()
-        pool = CommandPool(concurrency=10)
+        pool = CommandPool(concurrency=self.concurrency)
         logger.info("Scanning %s ..", pluralize(len(locations), "backup location"))
         for location in locations:
             for cmd in self.rotate_backups(location, prepare=True, **kw):
                 pool.add(cmd)
         if pool.num_commands > 0:
-            backups = pluralize(pool.num_commands, "backup")
-            logger.info("Preparing to rotate %s (in parallel) ..", backups)
+            commands = pluralize(pool.num_commands, "removal command")
+            logger.info("Preparing to run %s (in parallel) ..", commands)
             pool.run()
-            logger.info("Successfully rotated %s in %s.", backups, timer)
+            logger.info("Successfully ran %s in %s.", commands, timer)
 
     def rotate_backups(self, location, load_config=True, prepare=False):
         """
@@ -580,38 +685,74 @@ class RotateBackups(PropertyManager):
         # Find which backups to preserve and why.
         backups_to_preserve = self.find_preservation_criteria(backups_by_frequency)
         # Apply the calculated rotation scheme.
+        backups_to_remove = []
+        # Don't format log messages that won't be emitted anyway.
+        log_decisions = logger.isEnabledFor(logging.INFO)
         for backup in sorted_backups:
-            friendly_name = backup.pathname
-            if not location.is_remote:
-                # Use human friendly pathname formatting for local backups.
-                friendly_name = format_path(backup.pathname)
-            if backup in backups_to_preserve:
-                matching_periods = backups_to_preserve[backup]
-                logger.info("Preserving %s (matches %s retention %s) ..",
-                            friendly_name, concatenate(map(repr, matching_periods)),
-                            "period" if len(matching_periods) == 1 else "periods")
-            else:
-                logger.info("Deleting %s ..", friendly_name)
-                if not self.dry_run:
-                    # Copy the list with the (possibly user defined) removal command.
-                    removal_command = list(self.removal_command)
-                    # Add the pathname of the backup as the final argument.
-                    removal_command.append(backup.pathname)
-                    # Construct the command object.
-                    command = location.context.prepare(
-                        command=removal_command,
-                        group_by=(location.ssh_alias, location.mount_point),
-                        ionice=self.io_scheduling_class,
-                    )
-                    rotation_commands.append(command)
-                    if not prepare:
-                        timer = Timer()
-                        command.wait()
-                        logger.verbose("Deleted %s in %s.", friendly_name, timer)
+            matching_periods = backups_to_preserve.get(backup)
+            if not matching_periods:
+                backups_to_remove.append(backup)
+            if log_decisions:
+                friendly_name = backup.pathname
+                if not location.is_remote:
+                    # Use human friendly pathname formatting for local backups.
+                    friendly_name = format_path(backup.pathname)
+                if matching_periods:
+                    logger.info("Preserving %s (matches %s retention %s) ..",
+                                friendly_name, concatenate(map(repr, matching_periods)),
+                                "period" if len(matching_periods) == 1 else "periods")
+                else:
+                    logger.info("Deleting %s ..", friendly_name)
+        if backups_to_remove and not self.dry_run:
+            timer = Timer()
+            for pathnames in self.batch_removals(backups_to_remove):
+                # Copy the list with the (possibly user defined) removal command.
+                removal_command = list(self.removal_command)
+                # Add the pathname(s) of the backup(s) as the final argument(s).
+                removal_command.extend(pathnames)
+                # Construct the command object.
+                command = location.context.prepare(
+                    command=removal_command,
+                    group_by=(location.ssh_alias, location.mount_point),
+                    ionice=self.io_scheduling_class,
+                )
+                rotation_commands.append(command)
+                if not prepare:
+                    command.wait()
+            if not prepare:
+                logger.verbose("Deleted %s in %s.", pluralize(len(backups_to_remove), "backup"), timer)
         if len(backups_to_preserve) == len(sorted_backups):
             logger.info("Nothing to do! (all backups preserved)")
         return rotation_commands
 
+    def batch_removals(self, backups):
+        """
+        Group the pathnames of backups to be removed into batches.
+
+        :param backups: An iterable of :class:`Backup` objects.
+        :returns: A generator of lists with pathnames (strings).
+
+        When the default :attr:`removal_command` is used the pathnames of
+        multiple backups are passed to a single ``rm -fR`` command, to avoid
+        running an external command per backup. The combined length of the
+        pathnames in each batch is limited by :data:`REMOVAL_BATCH_LIMIT`.
+
+        Custom removal commands are given a single pathname per invocation
+        because there's no way to know whether they accept more than one.
+        """
+        batch = []
+        batch_size = 0
+        batch_limit = REMOVAL_BATCH_LIMIT if self.removal_command == DEFAULT_REMOVAL_COMMAND else 0
+        for backup in backups:
+            if batch and batch_size + len(backup.pathname) > batch_limit:
+                yield batch
+                batch = []
+                batch_size = 0
+            batch.append(backup.pathname)
+            batch_size += len(backup.pathname) + 1
+        if batch:
+            yield batch
+
     def load_config_file(self, location):
         """
         Load a rotation scheme and other options from a configuration file.
@@ -658,12 +799,15 @@ class RotateBackups(PropertyManager):
         location = coerce_location(location)
         logger.info("Scanning %s for backups ..", location)
         location.ensure_readable(self.force)
-        for entry in natsort(location.context.list_entries(location.directory)):
+        exclude_pattern = compile_filename_patterns(self.exclude_list)
+        include_pattern = compile_filename_patterns(self.include_list)
+        for entry in sorted(location.list_entries(), key=natural_sort_key):
             match = self.timestamp_pattern.search(entry)
             if match:
-                if self.exclude_list and any(fnmatch.fnmatch(entry, p) for p in self.exclude_list):
+                normalized_entry = os.path.normcase(entry)
+                if exclude_pattern and exclude_pattern.match(normalized_entry):
                     logger.verbose("Excluded %s (it matched the exclude list).", entry)
-                elif self.include_list and not any(fnmatch.fnmatch(entry, p) for p in self.include_list):
+                elif include_pattern and not include_pattern.match(normalized_entry):
                     logger.verbose("Excluded %s (it didn't match the include list).", entry)
                 else:
                     try:
@@ -677,7 +821,10 @@ class RotateBackups(PropertyManager):
                 logger.debug("Failed to match time stamp in filename: %s", entry)
         if backups:
             logger.info("Found %i timestamped backups in %s.", len(backups), location)
-        return sorted(backups)
+        # Sort the backups in place, computing the sort key (which matches
+        # the ordering of Backup objects) only once per backup.
+        backups.sort(key=lambda b: (b.timestamp, b.pathname))
+        return backups
 
     def match_to_datetime(self, match):
         """
@@ -690,34 +837,44 @@ class RotateBackups(PropertyManager):
                  string or the captured value cannot be interpreted as a
                  base-10 integer.
 
+        Backups created in the same batch often share the same timestamp, so
+        the conversions are cached in :attr:`timestamp_cache`, keyed by the
+        captured values.
+
         .. seealso:: :data:`SUPPORTED_DATE_COMPONENTS`
         """
-        kw = {}
         captures = match.groupdict()
         if self._is_unixtime:
-            base = int(match.groupdict().get("unixtime"))
-            # Try seconds- and milliseconds-precision timestamps.
-            for value in (base, base / 1000):
-                try:
-                    timestamp = datetime.datetime.fromtimestamp(value)
-                    break
-                except ValueError:
-                    timestamp = None
-            if timestamp is None:
-                raise ValueError("%r could not be extracted as unix timestamp")
-            else:
-                logger.verbose("Extracted timestamp %r from %r", timestamp, value)
-            return timestamp
+            key = captures.get("unixtime")
         else:
-            for component, required in SUPPORTED_DATE_COMPONENTS:
-                value = captures.get(component)
-                if value:
-                    kw[component] = int(value, 10)
-                elif required:
-                    raise ValueError("Missing required date component! (%s)" % component)
+            key = tuple(captures.get(component) for component, required in SUPPORTED_DATE_COMPONENTS)
+        timestamp = self.timestamp_cache.get(key)
+        if timestamp is None:
+            if self._is_unixtime:
+                base = int(key)
+                # Try seconds- and milliseconds-precision timestamps.
+                for value in (base, base / 1000):
+                    try:
+                        timestamp = datetime.datetime.fromtimestamp(value)
+                        break
+                    except ValueError:
+                        timestamp = None
+                if timestamp is None:
+                    raise ValueError("%r could not be extracted as unix timestamp")
                 else:
-                    kw[component] = 0
-            return datetime.datetime(**kw)
+                    logger.verbose("Extracted timestamp %r from %r", timestamp, value)
+            else:
+                kw = {}
+                for (component, required), value in zip(SUPPORTED_DATE_COMPONENTS, key):
+                    if value:
+                        kw[component] = int(value, 10)
+                    elif required:
+                        raise ValueError("Missing required date component! (%s)" % component)
+                    else:
+                        kw[component] = 0
+                timestamp = datetime.datetime(**kw)
+            self.timestamp_cache[key] = timestamp
+        return timestamp
 
     def group_backups(self, backups):
         """
@@ -729,17 +886,43 @@ class RotateBackups(PropertyManager):
                   dictionaries. Each nested dictionary contains lists of
                   :class:`Backup` objects that are grouped together because
                   they belong into the same time unit for the corresponding
-                  rotation frequency.
+                  rotation frequency. The dictionaries of rotation frequencies
+                  that are not part of :attr:`rotation_scheme` are empty.
         """
-        backups_by_frequency = dict((frequency, collections.defaultdict(list)) for frequency in SUPPORTED_FREQUENCIES)
+        minutely, hourly, daily, weekly, monthly, yearly = {}, {}, {}, {}, {}, {}
+        # Don't group backups by frequencies that apply_rotation_scheme() will
+        # ignore. This is decided once, outside of the loop below.
+        group_minutely = 'minutely' in self.rotation_scheme
+        group_hourly = 'hourly' in self.rotation_scheme
+        group_daily = 'daily' in self.rotation_scheme
+        group_weekly = 'weekly' in self.rotation_scheme
+        group_monthly = 'monthly' in self.rotation_scheme
+        group_yearly = 'yearly' in self.rotation_scheme
         for b in backups:
-            backups_by_frequency['minutely'][(b.year, b.month, b.day, b.hour, b.minute)].append(b)
-            backups_by_frequency['hourly'][(b.year, b.month, b.day, b.hour)].append(b)
-            backups_by_frequency['daily'][(b.year, b.month, b.day)].append(b)
-            backups_by_frequency['weekly'][(b.year, b.week)].append(b)
-            backups_by_frequency['monthly'][(b.year, b.month)].append(b)
-            backups_by_frequency['yearly'][b.year].append(b)
-        return backups_by_frequency
+            # Look up the date components once (avoiding __getattr__()).
+            timestamp = b.timestamp
+            year, month, day = timestamp.year, timestamp.month, timestamp.day
+            hour = timestamp.hour
+            if group_minutely:
+                minutely.setdefault((year, month, day, hour, timestamp.minute), []).append(b)
+            if group_hourly:
+                hourly.setdefault((year, month, day, hour), []).append(b)
+            if group_daily:
+                daily.setdefault((year, month, day), []).append(b)
+            if group_weekly:
+                weekly.setdefault((year, b.week), []).append(b)
+            if group_monthly:
+                monthly.setdefault((year, month), []).append(b)
+            if group_yearly:
+                yearly.setdefault(year, []).append(b)
+        return dict(
+            minutely=minutely,
+            hourly=hourly,
+            daily=daily,
+            weekly=weekly,
+            monthly=monthly,
+            yearly=yearly,
+        )
 
     def apply_rotation_scheme(self, backups_by_frequency, most_recent_backup):
         """
@@ -767,10 +950,11 @@ class RotateBackups(PropertyManager):
                 # Reduce the number of backups in each time slot of this
                 # rotation frequency to a single backup (the oldest one or the
                 # newest one).
-                for period, backups_in_period in backups.items():
-                    index = -1 if self.prefer_recent else 0
-                    selected_backup = sorted(backups_in_period)[index]
-                    backups[period] = [selected_backup]
+                select_backup = max if self.prefer_recent else min
+                selected_backups = dict(
+                    (period, select_backup(backups_in_period))
+                    for period, backups_in_period in backups.items()
+                )
                 # Check if we need to rotate away backups in old periods.
                 retention_period = self.rotation_scheme[frequency]
                 if retention_period != 'always':
@@ -778,16 +962,23 @@ class RotateBackups(PropertyManager):
                     # rotation frequency? (relative to the most recent backup)
                     if self.strict:
                         minimum_date = most_recent_backup - SUPPORTED_FREQUENCIES[frequency] * retention_period
-                        for period, backups_in_period in list(backups.items()):
-                            for backup in backups_in_period:
-                                if backup.timestamp < minimum_date:
-                                    backups_in_period.remove(backup)
-                            if not backups_in_period:
-                                backups.pop(period)
+                        selected_backups = dict(
+                            (period, backup) for period, backup in selected_backups.items()
+                            if backup.timestamp >= minimum_date
+                        )
                     # If there are more periods remaining than the user
                     # requested to be preserved we delete the oldest one(s).
-                    items_to_preserve = sorted(backups.items())[-retention_period:]
-                    backups_by_frequency[frequency] = dict(items_to_preserve)
+                    # A retention period of zero doesn't remove any periods
+                    # (for backwards compatibility).
+                    if 0 < retention_period < len(selected_backups):
+                        selected_backups = dict(
+                            (period, selected_backups[period])
+                            for period in heapq.nlargest(retention_period, selected_backups)
+                        )
+                # Store the selected backups in the format generated by group_backups().
+                backups_by_frequency[frequency] = dict(
+                    (period, [backup]) for period, backup in selected_backups.items()
+                )
 
     def find_preservation_criteria(self, backups_by_frequency):
         """
@@ -797,14 +988,16 @@ class RotateBackups(PropertyManager):
                                      :func:`group_backups()` which has been
                                      processed by :func:`apply_rotation_scheme()`.
         :returns: A :class:`dict` with :class:`Backup` objects as keys and
-                  :class:`list` objects containing strings (rotation
+                  :class:`list` objects containing unique strings (rotation
                   frequencies) as values.
         """
-        backups_to_preserve = collections.defaultdict(list)
+        backups_to_preserve = {}
         for frequency, delta in ORDERED_FREQUENCIES:
             for period in backups_by_frequency[frequency].values():
                 for backup in period:
-                    backups_to_preserve[backup].append(frequency)
+                    matching_frequencies = backups_to_preserve.setdefault(backup, [])
+                    if frequency not in matching_frequencies:
+                        matching_frequencies.append(frequency)
         return backups_to_preserve
 
 
@@ -820,6 +1013,28 @@ class Location(PropertyManager):
     def directory(self):
         """The pathname of a directory containing backups (a string)."""
 
+    @lazy_property
+    def have_direct_access(self):
+        """
+        :data:`True` if :attr:`directory` can be accessed directly, :data:`False` otherwise.
+
+        This is only the case when the execution context is a
+        :class:`~executor.contexts.LocalContext` (remote contexts and e.g.
+        chroot contexts see a different filesystem) that doesn't use
+        :attr:`~executor.ExternalCommand.sudo`,
+        :attr:`~executor.ExternalCommand.uid` or
+        :attr:`~executor.ExternalCommand.user` (because the current process
+        may lack the filesystem permissions of such a context).
+
+        Direct access is used by :func:`list_entries()` and the sanity checks
+        (:func:`ensure_exists()`, :func:`ensure_readable()` and
+        :func:`ensure_writable()`) to avoid running an external command for
+        each of these operations.
+        """
+        if isinstance(self.context, LocalContext):
+            return not any(map(self.context.options.get, ('sudo', 'uid', 'user')))
+        return False
+
     @lazy_property
     def have_ionice(self):
         """:data:`True` when ionice_ is available, :data:`False` otherwise."""
@@ -880,7 +1095,11 @@ class Location(PropertyManager):
 
         .. seealso:: :func:`ensure_readable()`, :func:`ensure_writable()` and :func:`add_hints()`
         """
-        if self.context.is_directory(self.directory):
+        if self.have_direct_access:
+            exists = os.path.isdir(self.directory)
+        else:
+            exists = self.context.is_directory(self.directory)
+        if exists:
             logger.verbose("Confirmed that location exists: %s", self)
             return True
         elif override:
@@ -907,7 +1126,11 @@ class Location(PropertyManager):
         # existence has been confirmed, to avoid multiple notices
         # about the same underlying problem.
         if self.ensure_exists(override):
-            if self.context.is_readable(self.directory):
+            if self.have_direct_access:
+                readable = os.access(self.directory, os.R_OK)
+            else:
+                readable = self.context.is_readable(self.directory)
+            if readable:
                 logger.verbose("Confirmed that location is readable: %s", self)
                 return True
             elif override:
@@ -934,7 +1157,11 @@ class Location(PropertyManager):
         # existence has been confirmed, to avoid multiple notices
         # about the same underlying problem.
         if self.ensure_exists(override):
-            if self.context.is_writable(self.directory):
+            if self.have_direct_access:
+                writable = os.access(self.directory, os.W_OK)
+            else:
+                writable = self.context.is_writable(self.directory)
+            if writable:
                 logger.verbose("Confirmed that location is writable: %s", self)
                 return True
             elif override:
@@ -967,6 +1194,22 @@ class Location(PropertyManager):
         sentences.append("To continue despite this failing sanity check you can use --force.")
         return " ".join(sentences)
 
+    def list_entries(self):
+        """
+        List the entries in :attr:`directory`.
+
+        :returns: A list of strings with the names of the directory entries.
+
+        When :attr:`have_direct_access` is :data:`True` the directory is read
+        using :func:`os.listdir()`, otherwise this method falls back to
+        :func:`~executor.contexts.AbstractContext.list_entries()` (which runs
+        ``find`` as an external command).
+        """
+        if self.have_direct_access:
+            return os.listdir(self.directory)
+        else:
+            return self.context.list_entries(self.directory)
+
     def match(self, location):
         """
         Check if the given location "matches".
@@ -1004,6 +1247,10 @@ class Backup(PropertyManager):
     :class:`Backup` objects are ordered first by their :attr:`timestamp` and
     second by their :attr:`pathname`. This class variable overrides
     :attr:`~property_manager.PropertyManager.key_properties`.
+
+    Because backups are compared a lot while sorting, the rich comparison
+    methods of :class:`Backup` compare these two properties directly
+    instead of going through :attr:`~property_manager.PropertyManager.key_values`.
     """
 
     @key_property
@@ -1014,16 +1261,74 @@ class Backup(PropertyManager):
     def timestamp(self):
         """The date and time when the backup was created (a :class:`~datetime.datetime` object)."""
 
+    @property
+    def year(self):
+        """The year of :attr:`timestamp` (a number)."""
+        return self.timestamp.year
+
+    @property
+    def month(self):
+        """The month of :attr:`timestamp` (a number)."""
+        return self.timestamp.month
+
+    @property
+    def day(self):
+        """The day of :attr:`timestamp` (a number)."""
+        return self.timestamp.day
+
+    @property
+    def hour(self):
+        """The hour of :attr:`timestamp` (a number)."""
+        return self.timestamp.hour
+
+    @property
+    def minute(self):
+        """The minute of :attr:`timestamp` (a number)."""
+        return self.timestamp.minute
+
+    @property
+    def second(self):
+        """The second of :attr:`timestamp` (a number)."""
+        return self.timestamp.second
+
     @property
     def week(self):
         """The ISO week number of :attr:`timestamp` (a number)."""
+        iso_year, iso_week, iso_weekday = self.timestamp.isocalendar()
         # for some days close to January 1, isocalendar()[1] may return the week number as 52 or 53
         # eg: date(2022, 1, 1).isocalendar() returns (2021, 52, 6)
-        if self.year == self.timestamp.isocalendar()[0] + 1:
+        if self.timestamp.year == iso_year + 1:
             return 0
         else:
-            return self.timestamp.isocalendar()[1]
+            return iso_week
+
+    def __lt__(self, other):
+        """Enable "less than" comparison for :class:`Backup` objects (see :attr:`key_properties`)."""
+        return ((self.timestamp, self.pathname) < (other.timestamp, other.pathname)
+                if isinstance(other, Backup) else NotImplemented)
+
+    def __le__(self, other):
+        """Enable "less than or equal" comparison for :class:`Backup` objects (see :attr:`key_properties`)."""
+        return ((self.timestamp, self.pathname) <= (other.timestamp, other.pathname)
+                if isinstance(other, Backup) else NotImplemented)
+
+    def __gt__(self, other):
+        """Enable "greater than" comparison for :class:`Backup` objects (see :attr:`key_properties`)."""
+        return ((self.timestamp, self.pathname) > (other.timestamp, other.pathname)
+                if isinstance(other, Backup) else NotImplemented)
+
+    def __ge__(self, other):
+        """Enable "greater than or equal" comparison for :class:`Backup` objects (see :attr:`key_properties`)."""
+        return ((self.timestamp, self.pathname) >= (other.timestamp, other.pathname)
+                if isinstance(other, Backup) else NotImplemented)
 
     def __getattr__(self, name):
-        """Defer attribute access to :attr:`timestamp`."""
+        """
+        Defer attribute access to :attr:`timestamp`.
+
+        This is only used for attributes of :class:`~datetime.datetime`
+        objects that don't have an explicit property (like :attr:`year`),
+        because :func:`__getattr__()` is called after the normal
+        attribute lookup has failed (which makes it slow).
+        """
         return getattr(self.timestamp, name)
@@ -91,14 +91,19 @@ Supported options:
 
   -j, --parallel
 
-    Remove backups in parallel, one backup per mount point at a time. The idea
-    behind this approach is that parallel rotation is most useful when the
-    files to be removed are on different disks and so multiple devices can be
-    utilized at the same time.
+    Remove backups in parallel, one removal command per mount point at a time.
+    The idea behind this approach is that parallel rotation is most useful when
+    the files to be removed are on different disks and so multiple devices can
+    be utilized at the same time.
 
     Because mount points are per system the -j, --parallel option will also
     parallelize over backups located on multiple remote systems.
 
+  -J, --concurrency=COUNT
+
+    Run at most COUNT removal commands at the same time when the -j,
+    --parallel option is used (defaults to 10).
+
   -p, --prefer-recent
 
     By default the first (oldest) backup in each time slot is preserved. If
@@ -220,6 +225,7 @@ from verboselogs import VerboseLogger
 # Modules included in our package.
 from rotate_backups import (
     RotateBackups,
+    coerce_concurrency,
     coerce_location,
     coerce_retention_period,
     load_config_file,
@@ -242,10 +248,10 @@ def main():
     selected_locations = []
     # Parse the command line arguments.
     try:
-        options, arguments = getopt.getopt(sys.argv[1:], 'M:H:d:w:m:y:t:I:x:jpri:c:C:uS:fnvqh', [
+        options, arguments = getopt.getopt(sys.argv[1:], 'M:H:d:w:m:y:t:I:x:jJ:pri:c:C:uS:fnvqh', [
             'minutely=', 'hourly=', 'daily=', 'weekly=', 'monthly=', 'yearly=',
             'timestamp-pattern=', 'include=', 'exclude=', 'parallel',
-            'prefer-recent', 'relaxed', 'ionice=', 'config=',
+            'concurrency=', 'prefer-recent', 'relaxed', 'ionice=', 'config=',
             'removal-command=', 'use-sudo', 'syslog=', 'force',
             'dry-run', 'verbose', 'quiet', 'help',
         ])
@@ -270,6 +276,8 @@ def main():
                 kw['exclude_list'].append(value)
             elif option in ('-j', '--parallel'):
                 parallel = True
+            elif option in ('-J', '--concurrency'):
+                kw['concurrency'] = coerce_concurrency(value)
             elif option in ('-p', '--prefer-recent'):
                 kw['prefer_recent'] = True
             elif option in ('-r', '--relaxed'):
@@ -14,16 +14,24 @@ import os
 
 # External dependencies.
 from executor import ExternalCommandFailed
+from executor.concurrent import CommandPool
 from executor.contexts import RemoteContext
 from humanfriendly.testing import TemporaryDirectory, TestCase, run_cli, touch
+from natsort import natsort
 from six.moves import configparser
 
 # The module we're testing.
+import rotate_backups
 from rotate_backups import (
+    DEFAULT_REMOVAL_COMMAND,
+    Backup,
     RotateBackups,
+    coerce_concurrency,
     coerce_location,
     coerce_retention_period,
+    compile_filename_patterns,
     load_config_file,
+    natural_sort_key,
 )
 from rotate_backups.cli import main
 
@@ -115,6 +123,19 @@ class RotateBackupsTestCase(TestCase):
         assert isinstance(location.context, RemoteContext)
         assert location.directory == '/some/directory'
 
+    def test_list_entries(self):
+        """Test that local directories are listed directly."""
+        with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
+            self.create_sample_backup_set(root)
+            location = coerce_location(root)
+            assert location.have_direct_access
+            assert sorted(location.list_entries()) == sorted(location.context.list_entries(root))
+            # Contexts that switch users need to list the directory using `find'.
+            assert not coerce_location(root, sudo=True).have_direct_access
+            # Contexts that aren't local nor remote (e.g. a chroot) see a
+            # different filesystem, so they can't be accessed directly.
+            assert not coerce_location(root, chroot_name='rotate-backups-test-suite').have_direct_access
+
     def test_argument_validation(self):
         """Test argument validation."""
         # Test that an invalid ionice scheduling class causes an error to be reported.
@@ -145,6 +166,17 @@ class RotateBackupsTestCase(TestCase):
             returncode, output = run_cli(main, '-n', '/root')
             assert returncode != 0
 
+    def test_backup_ordering(self):
+        """Test that backups are ordered by their timestamp and pathname."""
+        timestamp = datetime.datetime(2020, 5, 17)
+        first = Backup(pathname='/backups/b', timestamp=timestamp)
+        second = Backup(pathname='/backups/a', timestamp=timestamp + datetime.timedelta(seconds=1))
+        third = Backup(pathname='/backups/c', timestamp=timestamp + datetime.timedelta(seconds=1))
+        assert sorted([third, second, first]) == [first, second, third]
+        assert first < second <= third
+        assert third > second >= first
+        assert not first > first
+
     def test_timestamp_dates(self):
         """Make sure filenames with unix timestamps don't cause an exception."""
         with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
@@ -172,6 +204,21 @@ class RotateBackupsTestCase(TestCase):
             assert len(backups) == 1
             assert backups[0].pathname == file_with_valid_date
 
+    def test_timestamp_pattern(self):
+        """Make sure implausible digit groups don't hide valid timestamps."""
+        with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
+            file_with_leading_digits = os.path.join(root, 'backup-9999999-2020-01-01')
+            file_with_invalid_hour = os.path.join(root, 'snapshot-20200101-3000')
+            file_with_invalid_year = os.path.join(root, 'snapshot-31000101')
+            for filename in file_with_leading_digits, file_with_invalid_hour, file_with_invalid_year:
+                touch(filename)
+            program = RotateBackups(rotation_scheme=dict(monthly='always'))
+            backups = dict((b.pathname, b.timestamp) for b in program.collect_backups(root))
+            assert backups == {
+                file_with_leading_digits: datetime.datetime(2020, 1, 1),
+                file_with_invalid_hour: datetime.datetime(2020, 1, 1),
+            }
+
     def test_dry_run(self):
         """Make sure dry run doesn't remove any backups."""
         with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
@@ -267,6 +314,37 @@ class RotateBackupsTestCase(TestCase):
             backups_that_were_preserved = set(os.listdir(root))
             assert backups_that_were_preserved == expected_to_be_preserved
 
+    def test_concurrency(self):
+        """Test that the concurrency of :func:`.rotate_concurrent()` can be customized."""
+        # Test that the concurrency is coerced to a positive integer.
+        assert coerce_concurrency('3') == 3
+        self.assertRaises(ValueError, coerce_concurrency, '0')
+        self.assertRaises(ValueError, coerce_concurrency, 'many')
+        assert RotateBackups(concurrency='5', rotation_scheme=dict(monthly='always')).concurrency == 5
+        self.assertRaises(ValueError, RotateBackups, concurrency=-1, rotation_scheme=dict(monthly='always'))
+        # Test that the command line option reaches the command pool.
+        pools = []
+
+        def create_pool(**options):
+            pool = CommandPool(**options)
+            pools.append(pool)
+            return pool
+
+        with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
+            self.create_sample_backup_set(root)
+            original_pool = rotate_backups.CommandPool
+            rotate_backups.CommandPool = create_pool
+            try:
+                returncode, output = run_cli(main, '--parallel', '--concurrency=3', '--monthly=always', root)
+            finally:
+                rotate_backups.CommandPool = original_pool
+            assert returncode == 0
+            assert len(pools) == 1
+            assert pools[0].concurrency == 3
+        # Test that invalid values are rejected by the command line interface.
+        returncode, output = run_cli(main, '--parallel', '--concurrency=0', '--monthly=always', '/tmp')
+        assert returncode != 0
+
     def test_include_list(self):
         """Test include list logic."""
         # These are the backups expected to be preserved within the year 2014
@@ -304,6 +382,20 @@ class RotateBackupsTestCase(TestCase):
             backups_that_were_preserved = set(os.listdir(root))
             assert backups_that_were_preserved == expected_to_be_preserved
 
+    def test_natural_sort_key(self):
+        """Test that :func:`.natural_sort_key()` sorts like :func:`natsort.natsort()`."""
+        names = list(SAMPLE_BACKUP_SET) + ['backup-9', 'backup-10', 'backup-1.2', 'backup-1.10', 'backup-1']
+        assert sorted(names, key=natural_sort_key) == natsort(names)
+
+    def test_filename_pattern_compilation(self):
+        """Test that combined filename patterns match like :func:`fnmatch.fnmatch()`."""
+        assert compile_filename_patterns([]) is None
+        pattern = compile_filename_patterns(['2014-*', '*@20:0[0-4]'])
+        assert pattern.match('2014-01-01@20:07')
+        assert pattern.match('2013-10-10@20:04')
+        assert not pattern.match('2013-10-10@20:07')
+        assert not pattern.match('backup-2014-01-01')
+
     def test_exclude_list(self):
         """Test exclude list logic."""
         # These are the backups expected to be preserved. After each backup
@@ -429,6 +521,16 @@ class RotateBackupsTestCase(TestCase):
             commands = program.rotate_backups(root, prepare=True)
             assert any(cmd.command_line[0] == 'rmdir' for cmd in commands)
 
+    def test_batched_removal(self):
+        """Test that the default removal command is given multiple backups at once."""
+        with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
+            self.create_sample_backup_set(root)
+            program = RotateBackups(rotation_scheme=dict(monthly='always'))
+            commands = program.rotate_backups(root, prepare=True)
+            assert len(commands) == 1
+            assert commands[0].command_line[:2] == DEFAULT_REMOVAL_COMMAND
+            assert len(commands[0].command_line) > 3
+
     def test_force(self):
         """Test that sanity checks can be overridden."""
         with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
@@ -447,6 +549,15 @@ class RotateBackupsTestCase(TestCase):
                 program = RotateBackups(rotation_scheme=dict(monthly='always'))
                 self.assertRaises(ValueError, program.rotate_backups, root)
 
+    def test_sanity_checks_use_context(self):
+        """Test that sanity checks of non-local contexts aren't performed on the local filesystem."""
+        with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root:
+            assert coerce_location(root).ensure_writable()
+            # The directory exists on the host, but not in this (nonexistent) chroot.
+            location = coerce_location(root, chroot_name='rotate-backups-test-suite')
+            assert not location.ensure_exists(override=True)
+            self.assertRaises(ValueError, location.ensure_readable)
+
     def test_ensure_writable_optional(self):
         """Test that ensure_writable() isn't called when a custom removal command is used."""
         with TemporaryDirectory(prefix='rotate-backups-', suffix='-test-suite') as root: